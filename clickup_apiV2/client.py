@@ -1,9 +1,81 @@
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
 class Client:
+    # Number of task pages requested concurrently by get_list_tasks
+    max_page_workers = 8
+    # Seconds (or a (connect, read) tuple) before a request is given up; None waits forever
+    timeout = None
+
     def __init__(self,api_token):
         self.server = "https://api.clickup.com"
         self.api_token = api_token
+        self._reset_connection_state()
+
+    def _reset_connection_state(self):
+        # requests.Session is not thread-safe, so every thread (the caller and
+        # each page worker) keeps its own keep-alive session
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._page_executor = None
+        self._page_executor_size = None
+
+    def __getstate__(self):
+        # Connections, locks and worker threads cannot be pickled or copied;
+        # the copy opens its own on first use
+        state = self.__dict__.copy()
+        for key in ("_local", "_sessions", "_lock", "_page_executor", "_page_executor_size"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset_connection_state()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def session(self):
+        """Keep-alive requests.Session owned by the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self):
+        """Stop the page workers and close every pooled connection."""
+        with self._lock:
+            executor, self._page_executor = self._page_executor, None
+            sessions, self._sessions = self._sessions, []
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+    def _get_page_executor(self):
+        """Page worker pool, kept alive between calls so worker sessions stay warm.
+
+        The pool is rebuilt when max_page_workers has changed since it was created.
+        """
+        with self._lock:
+            if self._page_executor is not None and self._page_executor_size != self.max_page_workers:
+                # Pages already submitted by other calls still finish on the old pool
+                self._page_executor.shutdown(wait=False)
+                self._page_executor = None
+            if self._page_executor is None:
+                self._page_executor = ThreadPoolExecutor(max_workers=self.max_page_workers, thread_name_prefix="clickup-page")
+                self._page_executor_size = self.max_page_workers
+            return self._page_executor
 
 
     def get_team_id(self,format="full"):
@@ -15,7 +87,7 @@ class Client:
         url = f"{self.server}/api/v2/team"
         try:
             # Make the GET request
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
 
@@ -40,7 +112,7 @@ class Client:
         }
         try:
             # Make the GET request
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
 
@@ -63,7 +135,7 @@ class Client:
             "Authorization": self.api_token
         }
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             folders = [{"id": folder["id"], "name": folder["name"]} for folder in data.get("folders", [])]
@@ -79,7 +151,7 @@ class Client:
             "Authorization": self.api_token
         }
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             lists = [{"id": lst["id"], "name": lst["name"]} for lst in data.get("lists", [])]
@@ -95,7 +167,7 @@ class Client:
             "Authorization": self.api_token
         }
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             lists = [{"id": lst["id"], "name": lst["name"]} for lst in data.get("lists", [])]
@@ -133,39 +205,57 @@ class Client:
         if debug:
             print(f"Starting pagination for list {list_id}")
 
-        while True:
-            # Add page parameter for this request
-            current_params = params.copy()
-            current_params['page'] = page
-
-            if debug:
-                self._debug_request(url, current_params, page)
-
-            try:
-                response = requests.get(url, headers=headers, params=current_params)
-
-                if debug and page == 0:
-                    self._debug_response(response)
-
-                response.raise_for_status()
-                data = response.json()
-
-                current_tasks = data.get('tasks', [])
-                all_tasks.extend(current_tasks)
-
-                if debug:
-                    print(f"Page {page}: Retrieved {len(current_tasks)} tasks")
-
-                # Check if we've reached the last page
-                is_last_page = data.get('last_page', True)
-                if is_last_page or len(current_tasks) == 0:
-                    break
-
-                page += 1
+        # Fetch the first page alone to learn whether more pages exist, then
+        # request the following pages in concurrent batches that double in
+        # size (up to max_page_workers) so short lists waste few requests
+        batch = [0]
+        futures = []
+        try:
+            executor = self._get_page_executor()
+            while batch:
+                futures = [
+                    (batch_page, executor.submit(self._fetch_task_page, url, headers, params, batch_page))
+                    for batch_page in batch
+                ]
+                is_last_page = False
+
+                for page, future in futures:
+                    response = future.result()
+
+                    # Report from this thread, in page order, so output never interleaves
+                    if debug:
+                        self._debug_request(url, {**params, 'page': page}, page)
+                        if page == 0:
+                            self._debug_response(response)
+
+                    response.raise_for_status()
+                    data = response.json()
+
+                    current_tasks = data.get('tasks', [])
+                    all_tasks.extend(current_tasks)
+
+                    if debug:
+                        print(f"Page {page}: Retrieved {len(current_tasks)} tasks")
+
+                    # Check if we've reached the last page
+                    is_last_page = data.get('last_page', True) or len(current_tasks) == 0
+                    if is_last_page:
+                        break
+
+                if is_last_page:
+                    # Pages requested past the last one are not needed
+                    for _, future in futures:
+                        future.cancel()
+                    batch = []
+                else:
+                    batch_size = min(len(batch) * 2, self.max_page_workers)
+                    batch = list(range(page + 1, page + 1 + batch_size))
 
-            except requests.exceptions.RequestException as e:
-                print(f"An error occurred while fetching tasks (page {page}): {e}")
-                return None
+        except requests.exceptions.RequestException as e:
+            for _, future in futures:
+                future.cancel()
+            print(f"An error occurred while fetching tasks (page {page}): {e}")
+            return None
 
         # Create final response with all tasks
         final_data = {
@@ -179,6 +269,14 @@ class Client:
 
         return self._format_task_response(final_data, format)
 
+    def _fetch_task_page(self, url, headers, params, page):
+        """Request a single page of list tasks and return the raw response."""
+        # Add page parameter for this request
+        current_params = params.copy()
+        current_params['page'] = page
+
+        return self.session.get(url, headers=headers, params=current_params, timeout=self.timeout)
+
     def _prepare_api_params(self, kwargs):
         """Convert parameters for ClickUp API compatibility."""
         params = {}
@@ -234,7 +332,7 @@ class Client:
             "Authorization": self.api_token
         }
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             custom_fields = [{"id": field["id"], "name": field["name"], "type": field.get("type")} for field in data.get("fields", [])]
@@ -252,7 +350,7 @@ class Client:
         }
         try:
             # Make the PUT request with custom_field_data in the JSON payload
-            response = requests.put(url, headers=headers, json=update_task_data)
+            response = self.session.put(url, headers=headers, json=update_task_data, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
 
@@ -270,7 +368,7 @@ class Client:
         }
         try:
             # Make the PUT request with custom_field_data in the JSON payload
-            response = requests.post(url, headers=headers, json=custom_field_data)
+            response = self.session.post(url, headers=headers, json=custom_field_data, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
 
@@ -317,7 +415,7 @@ class Client:
 
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.post(url, headers=headers, json=data)
+            response = self.session.post(url, headers=headers, json=data, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
 
@@ -337,7 +435,7 @@ class Client:
         }
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.delete(url, headers=headers)
+            response = self.session.delete(url, headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
 
@@ -357,7 +455,7 @@ class Client:
         payload={"value":value}
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.post(url,json=payload, headers=headers)
+            response = self.session.post(url,json=payload, headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
             # Return the response data or success message
@@ -377,7 +475,7 @@ class Client:
         }
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.get(url,headers=headers)
+            response = self.session.get(url,headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
             # Return the response data or success message
@@ -398,7 +496,7 @@ class Client:
         }
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.get(url,headers=headers)
+            response = self.session.get(url,headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
             # Return the response data or success message
@@ -416,7 +514,7 @@ class Client:
         }
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.put(url,json=body,headers=headers)
+            response = self.session.put(url,json=body,headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
             # Return the response data or success message
@@ -434,7 +532,7 @@ class Client:
         }
         try:
             # Make the PUT request with data in the JSON payload
-            response = requests.put(url,headers=headers)
+            response = self.session.put(url,headers=headers, timeout=self.timeout)
             # Raise an exception for HTTP errors
             response.raise_for_status()
             # Return the response data or success message
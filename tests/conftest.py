@@ -0,0 +1,306 @@
+import collections
+import contextlib
+import functools
+import logging
+import os
+import re
+import tempfile
+import threading
+import urllib.parse
+from types import SimpleNamespace
+import orjson
+import pytest
+import requests
+import responses
+import vcr
+from urllib3.util.retry import Retry
+from vcr.persisters.filesystem import FilesystemPersister
+from vcr.serialize import serialize
+from clickup_apiV2.client import Client
+
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Credentials the JSON fixtures stand in for when no API token is configured
+MOCK_API_TOKEN = "pk_mocked"
+MOCK_LIST_ID = "900100000001"
+# Tasks per page returned by ClickUp's list-task endpoint
+MOCK_PAGE_SIZE = 100
+
+# (connect, read) seconds before a test request gives up instead of hanging the suite
+HTTP_TIMEOUT = (3.05, 10)
+
+# VCR.py logs whole request and response bodies; keep debug output readable
+logging.getLogger("vcr").setLevel(logging.WARNING)
+
+# Never write the API token into recorded cassettes
+VCR_CONFIG = {
+    "filter_headers": ["authorization"],
+}
+
+
+def _record_mode(config):
+    """Record missing cassettes on the first run and replay them afterwards."""
+    return config.getoption("--record-mode") or "once"
+
+
+def _mocked():
+    """Serve the API from tests/fixtures unless a real API token is configured."""
+    return not os.getenv('CLICKUP_API_TOKEN')
+
+
+def pytest_collection_modifyitems(config, items):
+    if not _mocked():
+        return
+    skip_live = pytest.mark.skip(reason="needs the live API: set CLICKUP_API_TOKEN")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _list_tasks_callback(request):
+    """Serve the fixture tasks page by page, filtered like the list-task endpoint."""
+    query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(request.url).query))
+    if query.get("subtasks") == "true":
+        tasks = _load_fixture("subtasks_response.json")["tasks"]
+    else:
+        tasks = _load_fixture("subtasks_response_no_subtasks.json")["tasks"]
+    if query.get("include_closed") != "true":
+        tasks = [task for task in tasks if task["status"]["type"] != "closed"]
+    page = int(query.get("page", 0))
+    body = {
+        "tasks": tasks[page * MOCK_PAGE_SIZE:(page + 1) * MOCK_PAGE_SIZE],
+        "last_page": (page + 1) * MOCK_PAGE_SIZE >= len(tasks),
+    }
+    return 200, {"Content-Type": "application/json"}, orjson.dumps(body)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_clickup_api():
+    """Answer list-task requests from the JSON fixtures when running without a token."""
+    if not _mocked():
+        yield None
+        return
+    url = re.compile(rf"https://api\.clickup\.com/api/v2/list/{MOCK_LIST_ID}/task(\?|$)")
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(responses.GET, url, callback=_list_tasks_callback)
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def vcr_config(pytestconfig):
+    """Shared VCR configuration for tests marked with ``pytest.mark.vcr``."""
+    return {**VCR_CONFIG, "record_mode": _record_mode(pytestconfig)}
+
+
+class AtomicPersister(FilesystemPersister):
+    """Save cassettes through a temporary file so parallel xdist workers never clobber each other."""
+
+    @staticmethod
+    def save_cassette(cassette_path, cassette_dict, serializer):
+        cassette_folder = os.path.dirname(cassette_path)
+        os.makedirs(cassette_folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cassette_folder, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(serialize(cassette_dict, serializer))
+        os.replace(tmp_path, cassette_path)
+
+
+@pytest.fixture(scope="session")
+def session_cassette(pytestconfig):
+    """Cassette factory for session-scoped fixtures, which run outside any test cassette.
+
+    With pytest-xdist every worker builds its own session fixtures, so the same
+    cassette may be recorded by several workers; writes are atomic and identical.
+    With --disable-recording the fixtures talk to the live API like the tests do,
+    and in mocked mode there is nothing to record.
+    """
+    if pytestconfig.getoption("--disable-recording") or _mocked():
+        return lambda name: contextlib.nullcontext()
+
+    cassette_dir = os.path.join(CASSETTE_DIR, "session")
+    record_mode = _record_mode(pytestconfig)
+    rewrite = record_mode == "rewrite"
+    if rewrite:
+        # VCR.py has no "rewrite" mode; drop each old recording and record afresh
+        record_mode = "new_episodes"
+    recorder = vcr.VCR(cassette_library_dir=cassette_dir, record_mode=record_mode, **VCR_CONFIG)
+    recorder.register_persister(AtomicPersister)
+
+    def use_cassette(name):
+        if rewrite:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cassette_dir, name))
+        return recorder.use_cassette(name)
+
+    return use_cassette
+
+
+@pytest.fixture(scope="session")
+def http_workers(pytestconfig):
+    """Number of HTTP requests tests may issue concurrently.
+
+    VCR.py briefly unpatches connections globally whenever it opens one, so
+    concurrent requests can bypass the active cassette. Only overlap requests
+    when running live with --disable-recording.
+    """
+    if pytestconfig.getoption("--disable-recording"):
+        return Client.max_page_workers
+    return 1
+
+
+@pytest.fixture(scope="session")
+def client(http_workers):
+    """Create a ClickUp client with API token from environment variables."""
+    client = Client(os.getenv('CLICKUP_API_TOKEN') or MOCK_API_TOKEN)
+    client.max_page_workers = http_workers
+    client.timeout = HTTP_TIMEOUT
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def test_list_id():
+    """Get list ID from environment variables."""
+    if _mocked():
+        return MOCK_LIST_ID
+    list_id = os.getenv('CLICKUP_TEST_LIST_ID')
+    if not list_id:
+        pytest.skip("CLICKUP_TEST_LIST_ID environment variable not set")
+    return list_id
+
+
+@pytest.fixture(scope="session")
+def thread_http_session(client):
+    """Return the calling thread's authenticated requests session, creating it on first use.
+
+    requests.Session is not thread-safe, so, as in Client, every thread that
+    makes raw API calls keeps its own keep-alive session.
+    """
+    local = threading.local()
+    sessions = []
+
+    def get_session():
+        session = getattr(local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"Content-Type": "application/json", "Authorization": client.api_token})
+            # One host and one thread per session, so a single connection; retry rate limits and server errors
+            retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+            session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retries))
+            local.session = session
+            sessions.append(session)
+        return session
+
+    yield get_session
+    for session in sessions:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def http_session(thread_http_session):
+    """Shared, authenticated requests session for raw API calls from the main thread."""
+    return thread_http_session()
+
+
+@pytest.fixture(scope="session")
+def cached_get_list_tasks(client, session_cassette):
+    """Memoized ``client.get_list_tasks`` shared by every test in the session.
+
+    Each distinct call records into its own session cassette, so replay does not
+    depend on which test happened to fill the cache first. Callers must not
+    mutate the returned data. A failed call raises instead of returning None,
+    so a transient API error is retried by the next caller rather than cached.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _get_list_tasks(list_id, frozen_kwargs):
+        kwargs = dict(frozen_kwargs)
+        name = "-".join(["get_list_tasks", list_id] + [f"{key}={value}" for key, value in sorted(kwargs.items())])
+        with session_cassette(f"{name}.yaml"):
+            response = client.get_list_tasks(list_id, **kwargs)
+        if response is None:
+            raise RuntimeError(f"get_list_tasks failed for list {list_id} with {kwargs}")
+        return response
+
+    def get_list_tasks(list_id, **kwargs):
+        return _get_list_tasks(list_id, frozenset(kwargs.items()))
+
+    return get_list_tasks
+
+
+@pytest.fixture(scope="session")
+def tasks_with_subtasks(cached_get_list_tasks, test_list_id):
+    """Fetch all tasks (including subtasks and closed tasks) once per session."""
+    return cached_get_list_tasks(test_list_id, subtasks=True, include_closed=True)
+
+
+@pytest.fixture(scope="session")
+def tasks_without_subtasks(cached_get_list_tasks, test_list_id):
+    """Fetch all top-level tasks (including closed tasks) once per session."""
+    return cached_get_list_tasks(test_list_id, subtasks=False, include_closed=True)
+
+
+@pytest.fixture(scope="session")
+def short_tasks_with_subtasks(cached_get_list_tasks, test_list_id):
+    """Fetch the short-format task list (including subtasks) once per session."""
+    return cached_get_list_tasks(test_list_id, format="short", subtasks=True, include_closed=True)
+
+
+def _index_tasks(response):
+    """Partition a list-task response into parents and subtasks in one place."""
+    tasks = response.get('tasks', [])
+    parents, children = [], []
+    for task in tasks:
+        (children if task.get('parent') else parents).append(task)
+    return SimpleNamespace(
+        tasks=tasks,
+        ids=frozenset(task['id'] for task in tasks),
+        id_to_name={task['id']: task['name'] for task in tasks},
+        children=children,
+        parents=parents,
+        counts=collections.Counter(task['parent'] for task in children),
+        subtask_count=len(children),
+        total_count=len(tasks),
+    )
+
+
+@pytest.fixture(scope="session")
+def task_index(tasks_with_subtasks):
+    """Partition the cached task list into parents and subtasks once per session."""
+    return _index_tasks(tasks_with_subtasks)
+
+
+@pytest.fixture(scope="session")
+def task_index_without_subtasks(tasks_without_subtasks):
+    """Index the cached top-level task list once per session."""
+    return _index_tasks(tasks_without_subtasks)
+
+
+@pytest.fixture(scope="session")
+def direct_url_response(client, test_list_id, http_session, session_cassette):
+    """Fetch a single unpaginated page straight from the API, bypassing the client."""
+    url = f"{client.server}/api/v2/list/{test_list_id}/task"
+    try:
+        with session_cassette(f"direct_url_response-{test_list_id}.yaml"):
+            response = http_session.get(
+                url,
+                params={"subtasks": "true", "include_closed": "true"},
+                timeout=HTTP_TIMEOUT
+            )
+        response.raise_for_status()
+        # orjson raises its own ValueError, not a RequestException, on a bad body
+        return orjson.loads(response.content)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        pytest.fail(f"Direct URL request failed: {e}")
+
+
+@pytest.fixture(scope="session")
+def direct_url_index(direct_url_response):
+    """Partition the direct-URL task list into parents and subtasks once per session."""
+    return _index_tasks(direct_url_response)
@@ -0,0 +1,235 @@
+import copy
+import json
+import pickle
+import threading
+import urllib.parse
+from unittest import mock
+
+import pytest
+import requests
+
+from clickup_apiV2.client import Client
+
+PAGE_SIZE = 100
+
+
+def _page_response(url, status_code=200, payload=None):
+    """Build a real ``requests.Response`` carrying a JSON payload."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.request = requests.Request("GET", url).prepare()
+    response._content = json.dumps(payload or {}).encode()
+    return response
+
+
+class FakeListTasksAPI:
+    """Serve ``total`` tasks in pages of PAGE_SIZE, recording every page requested.
+
+    With ``last_page`` set, that page is flagged as the last one while later
+    pages keep returning tasks, as a broken cut-off would then merge them.
+    """
+
+    def __init__(self, total, fail_page=None, last_page=None):
+        self.tasks = [{"id": f"t{i}", "name": f"Task {i}", "status": {"status": "open"}} for i in range(total)]
+        self.fail_page = fail_page
+        self.last_page = last_page
+        self.requested_pages = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        page = params["page"]
+        self.requested_pages.append(page)
+        full_url = f"{url}?{urllib.parse.urlencode(params)}"
+        if page == self.fail_page:
+            return _page_response(full_url, status_code=500)
+        if self.last_page is not None and page > self.last_page:
+            chunk = [{"id": "extra", "name": "Past last page", "status": {}}] * PAGE_SIZE
+            return _page_response(full_url, payload={"tasks": chunk, "last_page": False})
+        chunk = self.tasks[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        if self.last_page is not None:
+            last_page = page == self.last_page
+        else:
+            last_page = (page + 1) * PAGE_SIZE >= len(self.tasks)
+        return _page_response(full_url, payload={"tasks": chunk, "last_page": last_page})
+
+
+@pytest.fixture
+def client():
+    """Client with a dummy token; no request leaves the process."""
+    client = Client("pk_test")
+    client.max_page_workers = 4
+    yield client
+    client.close()
+
+
+def _get_list_tasks(client, api, **kwargs):
+    with mock.patch.object(requests.Session, "get", side_effect=api.get):
+        return client.get_list_tasks("L1", **kwargs)
+
+
+class TestGetListTasksPagination:
+    @pytest.mark.parametrize("total", [0, 50, 100, 150, 350, 1000])
+    def test_returns_every_task_in_page_order(self, client, total):
+        """Concurrent batches must still yield tasks in the API's page order."""
+        api = FakeListTasksAPI(total)
+
+        response = _get_list_tasks(client, api, subtasks=True)
+
+        assert [task["id"] for task in response["tasks"]] == [task["id"] for task in api.tasks]
+        assert response["last_page"] is True
+
+    def test_stops_at_last_page(self, client):
+        """Pages past the one flagged ``last_page`` are never merged into the result."""
+        api = FakeListTasksAPI(350, last_page=3)
+
+        response = _get_list_tasks(client, api)
+
+        assert [task["id"] for task in response["tasks"]] == [task["id"] for task in api.tasks]
+        # Batches double in size: [0], [1, 2], [3, 4, 5, 6]
+        assert max(api.requested_pages) <= 6
+
+    def test_stops_at_empty_page(self, client):
+        """An empty page ends pagination even while ``last_page`` is still False."""
+        api = FakeListTasksAPI(200, last_page=5)
+
+        response = _get_list_tasks(client, api)
+
+        assert len(response["tasks"]) == 200
+
+    def test_missing_last_page_is_treated_as_last(self, client):
+        """A page without a ``last_page`` key ends pagination after that page."""
+        api = FakeListTasksAPI(350)
+
+        def get(url, headers=None, params=None, timeout=None):
+            response = api.get(url, headers=headers, params=params)
+            payload = response.json()
+            del payload["last_page"]
+            response._content = json.dumps(payload).encode()
+            return response
+
+        with mock.patch.object(requests.Session, "get", side_effect=get):
+            response = client.get_list_tasks("L1")
+
+        assert [task["id"] for task in response["tasks"]] == [task["id"] for task in api.tasks[:PAGE_SIZE]]
+        assert api.requested_pages == [0]
+
+    def test_passes_page_and_api_params(self, client):
+        """Each page request carries the caller's parameters in ClickUp's format."""
+        calls = []
+        api = FakeListTasksAPI(150)
+
+        def get(url, headers=None, params=None, timeout=None):
+            calls.append((url, headers, dict(params), timeout))
+            return api.get(url, headers=headers, params=params)
+
+        client.timeout = (3.05, 10)
+
+        with mock.patch.object(requests.Session, "get", side_effect=get):
+            client.get_list_tasks("L1", subtasks=True, include_closed=False)
+
+        url, headers, params, timeout = calls[0]
+        assert url == "https://api.clickup.com/api/v2/list/L1/task"
+        assert headers["Authorization"] == "pk_test"
+        assert sorted(call[2]["page"] for call in calls) == [0, 1, 2]
+        assert params["subtasks"] == "true"
+        assert params["include_closed"] == "false"
+        assert all(call[3] == (3.05, 10) for call in calls)
+
+    def test_http_error_returns_none(self, client):
+        """A failing page aborts pagination and reports the error as ``None``."""
+        api = FakeListTasksAPI(1000, fail_page=2)
+
+        assert _get_list_tasks(client, api) is None
+
+    def test_short_format(self, client):
+        """Short format flattens every paginated task."""
+        api = FakeListTasksAPI(150)
+
+        tasks = _get_list_tasks(client, api, format="short")
+
+        assert len(tasks) == 150
+        assert tasks[0] == {"id": "t0", "name": "Task 0", "status": "open"}
+
+    def test_debug_output_in_page_order(self, client, capsys):
+        """Debug lines are printed by the calling thread, one page after another."""
+        api = FakeListTasksAPI(350)
+
+        _get_list_tasks(client, api, debug=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        page_lines = [line for line in lines if line.startswith(("URL:", "Page "))]
+        expected = []
+        for page in range(4):
+            expected += [f"URL: https://api.clickup.com/api/v2/list/L1/task (Page {page})",
+                         f"Page {page}: Retrieved {min(PAGE_SIZE, 350 - page * PAGE_SIZE)} tasks"]
+        assert page_lines == expected
+
+
+class TestClientSessions:
+    def test_session_is_reused_within_a_thread(self, client):
+        """Calls from one thread share a keep-alive session."""
+        assert client.session is client.session
+
+    def test_each_thread_gets_its_own_session(self, client):
+        """requests.Session is not thread-safe, so threads never share one."""
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(client.session))
+        thread.start()
+        thread.join()
+
+        assert sessions[0] is not client.session
+
+    def test_page_workers_keep_their_sessions_between_calls(self, client):
+        """The page pool outlives a call, so later calls reuse warm connections."""
+        api = FakeListTasksAPI(350)
+
+        _get_list_tasks(client, api)
+        sessions = list(client._sessions)
+        _get_list_tasks(client, api)
+
+        # The pool may still spawn a worker, but never replaces existing sessions
+        assert client._sessions[:len(sessions)] == sessions
+        assert len(client._sessions) <= client.max_page_workers
+
+    def test_close_releases_sessions_and_workers(self, client):
+        """close() shuts the page pool down and closes every session."""
+        _get_list_tasks(client, FakeListTasksAPI(350))
+        sessions = list(client._sessions)
+
+        with mock.patch.object(requests.Session, "close", autospec=True) as close:
+            client.close()
+
+        assert {call.args[0] for call in close.call_args_list} == set(sessions)
+        assert client._page_executor is None
+        assert client._sessions == []
+
+    def test_context_manager_closes_client(self):
+        """Using the client in a with block closes it on exit."""
+        with Client("pk_test") as client:
+            session = client.session
+
+        assert client._sessions == []
+        assert client.session is not session
+
+    def test_page_pool_follows_max_page_workers(self, client):
+        """Changing max_page_workers after a call resizes the page pool."""
+        _get_list_tasks(client, FakeListTasksAPI(350))
+        client.max_page_workers = 2
+
+        response = _get_list_tasks(client, FakeListTasksAPI(350))
+
+        assert len(response["tasks"]) == 350
+        assert client._page_executor._max_workers == 2
+
+    @pytest.mark.parametrize("duplicate", [lambda c: pickle.loads(pickle.dumps(c)), copy.deepcopy], ids=["pickle", "deepcopy"])
+    def test_client_can_be_pickled_and_copied(self, client, duplicate):
+        """Copies keep the settings but open their own connections."""
+        _get_list_tasks(client, FakeListTasksAPI(150))
+        client.timeout = 5
+
+        clone = duplicate(client)
+
+        assert (clone.api_token, clone.server, clone.max_page_workers, clone.timeout) == ("pk_test", client.server, 4, 5)
+        assert clone._sessions == [] and clone._page_executor is None
+        assert len(_get_list_tasks(clone, FakeListTasksAPI(150))["tasks"]) == 150
+        clone.close()